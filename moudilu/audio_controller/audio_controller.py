@@ -1,14 +1,21 @@
 #!/usr/bin/env python
 
 import logging
+import sys
 
-from argparse import ArgumentParser
-from asyncio import run, TaskGroup
+from functools import cache
+
+from argparse import ArgumentParser, BooleanOptionalAction
+import asyncio
+from asyncio import get_running_loop, run, Runner, TaskGroup
+from threading import Thread
 
 from .event_router import get_event_router
 
 
-def main() -> None:
+@cache
+def _build_parser() -> ArgumentParser:
+    """Build the argument parser once; cached for repeated invocations"""
     parser = ArgumentParser()
     parser.add_argument(
         "-log",
@@ -38,23 +45,44 @@ def main() -> None:
         type=int,
         help="Serve the REST API on the specified port.",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--uvloop",
+        action=BooleanOptionalAction,
+        default=sys.platform != "win32",
+        help="Run on the libuv-based uvloop instead of the default event loop.",
+    )
+    return parser
+
+
+def main() -> None:
+    args = _build_parser().parse_args()
+
+    if args.bt:
+        # dbus_fast is by far the heaviest import; pull it in on a background
+        # thread so it overlaps with logging setup and event loop start-up
+        Thread(target=lambda: __import__("dbus_fast.aio"), daemon=True).start()
 
     logging.basicConfig(level=args.loglevel.upper())
 
     logger = logging.getLogger()
 
     async def init():
+        # Start coroutines eagerly so tasks finishing without suspending are
+        # never scheduled on the loop. Only available on Python 3.12+.
+        if hasattr(asyncio, "eager_task_factory"):
+            get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
         async with TaskGroup() as tg:
             # Instantiate all devices
-            for pcm in args.pcm:
+            if args.pcm:
                 from .devices.pcm_monitor import PcmMonitor
 
-                PcmMonitor(tg, pcm)
+                for pcm in args.pcm:
+                    PcmMonitor(tg, pcm)
             if args.hk970:
                 from .devices.hk970 import HK970
 
-                HK970()
+                HK970(tg)
             if args.rc:
                 from .devices.remote_control import RemoteControl
 
@@ -71,11 +99,21 @@ def main() -> None:
             # Initialization complete, start forwarding events
             get_event_router().start_routing()
 
-    # Run the loop
-    run(init())
+    # Run the loop, on uvloop if requested and available
+    if args.uvloop:
+        try:
+            import uvloop
+        except ImportError:
+            logger.warning("uvloop is not installed, fall back to default event loop")
+            run(init())
+        else:
+            with Runner(loop_factory=uvloop.new_event_loop) as runner:
+                runner.run(init())
+    else:
+        run(init())
 
     logger.error("Loop exited unexpectedly. Stop audio controller.")
 
 
-if __name__ == "main":
+if __name__ == "__main__":
     main()
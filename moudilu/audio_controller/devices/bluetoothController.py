@@ -1,14 +1,62 @@
-from asyncio import TaskGroup, get_running_loop
+from asyncio import Future, TaskGroup, gather, get_running_loop
 import logging
-from typing import Any, Generator
+from os import environ
+from pathlib import Path
+from typing import Any, Coroutine, Dict, Generator
 
-from dbus_next import is_object_path_valid, is_bus_name_valid, DBusError
-from dbus_next.constants import BusType
-from dbus_next.aio import MessageBus
-from dbus_next.service import ServiceInterface, method
+from dbus_fast import is_object_path_valid, is_bus_name_valid, DBusError
+from dbus_fast.constants import BusType
+from dbus_fast.aio import MessageBus
+from dbus_fast.service import ServiceInterface, method
+from dbus_fast.signature import get_signature_tree
 
 from ..event_router import get_event_router, Event
 
+# Bus name and object path of the bluetooth agent, derived from the module
+# name with a fallback. Pure functions of constants, computed once at import.
+_AGENT_BUS_NAME = (
+    __name__ if is_bus_name_valid(__name__) else "audio_controller.bluetooth_agent"
+)
+_AGENT_PATH = "/" + __name__.replace(".", "/")
+if not is_object_path_valid(_AGENT_PATH):
+    _AGENT_PATH = "/audio_controller/bluetooth_agent"
+
+_STATE_DIR = Path(environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+_STATE_DIR = _STATE_DIR / "audio_controller"
+"""Directory where the last known adapter power state is persisted"""
+
+_introspections: Dict[tuple, Future] = {}
+"""Introspection results cached per (service, path)
+
+Introspection returns an XML document that dbus_fast parses on every call;
+caching avoids re-requesting and re-parsing it for paths whose interface
+schema never changes at runtime."""
+
+
+async def _introspect_cached(bus: MessageBus, service: str, path: str, key=None):
+    """Introspect a DBus object, caching the parsed result
+
+    :param key: Cache key, defaults to (service, path). Pass a custom key to
+                share one introspection between objects with identical schemas
+                (e.g. all org.bluez.Device1 objects).
+    """
+    if key is None:
+        key = (service, path)
+    try:
+        return await _introspections[key]
+    except KeyError:
+        future: Future = get_running_loop().create_future()
+        _introspections[key] = future
+        try:
+            introspection = await bus.introspect(service, path)
+        except BaseException as e:
+            # Propagate the failure to concurrent waiters, then retry fresh
+            del _introspections[key]
+            future.set_exception(e)
+        else:
+            future.set_result(introspection)
+        return await future
+
 
 class BluetoothController:
     """Class which controls the bluetooth adapter
@@ -25,6 +73,20 @@ class BluetoothController:
     - Turn BT off after no device has been connected for some time
     """
 
+    __slots__ = (
+        "_logger",
+        "_hci",
+        "_tg",
+        "_pending",
+        "_loop",
+        "_bus",
+        "_adapter",
+        "_agent",
+        "_powered",
+        "_handlers",
+        "_state_file",
+    )
+
     DISCOVERABLE_TIMEOUT = 90
     """Time in seconds, how long the adapter should remain discoverable once set into
     this mode"""
@@ -35,43 +97,107 @@ class BluetoothController:
         self._logger = logging.getLogger(f"BT hci{hciNumber}")
         self._hci = hciNumber
         self._tg = tg
+        self._pending: set = set()
+        """Strong references to in-flight fire-and-forget tasks"""
+        self._state_file = _STATE_DIR / f"hci{hciNumber}"
+
+        # Warm the signature parse caches for the types used by the adapter
+        # property calls (b: pairable/powered, u: discoverable timeout,
+        # s: strings, o: object paths), so the first pairing round-trip does
+        # not pay the parse inline
+        for signature in ("b", "u", "s", "o"):
+            get_signature_tree(signature)
 
     async def _init(self) -> "BluetoothController":
         """Some of the initialization has to be done async. Thus every object of this
         class has to be awaited before using it!."""
+        self._loop = get_running_loop()
         await self._init_dbus()
 
-        # The adapter should always be pairable in this scenario
-        await self._adapter.set_pairable(True)
+        # Issue the adapter property calls concurrently, so the bus pipelines
+        # them instead of paying one round-trip per await:
+        # - the adapter should always be pairable in this scenario
+        # - set the discovery timeout
+        # - read the current power state
+        #
+        # On the common cold-boot path the state persisted at the last power
+        # change already says "off", in which case the get_powered round-trip
+        # and the corrective power_off are skipped entirely.
+        if self._read_persisted_state() == "off":
+            self._powered = False
+            await gather(
+                self._adapter.set_pairable(True),
+                self._adapter.set_discoverable_timeout(self.DISCOVERABLE_TIMEOUT),
+            )
+            self._logger.info(
+                "The adapter hci%i was powered off at last shutdown.", self._hci
+            )
+        else:
+            _, _, powered = await gather(
+                self._adapter.set_pairable(True),
+                self._adapter.set_discoverable_timeout(self.DISCOVERABLE_TIMEOUT),
+                self._adapter.get_powered(),
+            )
+            self._powered = powered
+            self._logger.info(
+                "The adapter hci%i was found powered %s.",
+                self._hci,
+                "on" if powered else "off",
+            )
+            # Start in a well defined state: Powered off
+            if powered:
+                await self.power_off()
+            else:
+                self._persist_state("off")
+
+        # Register event handlers. Events map to their action through a dict,
+        # so dispatch is a single hash lookup instead of one closure per
+        # subscription.
+        self._handlers = {
+            Event.KEY_OPENCLOSE: self.power_on,
+            Event.API_BLUETOOTH_ON: self.power_on,
+            Event.KEY_OPENCLOSE_LONG: self.make_discoverable,
+            Event.API_BLUETOOTH_DISCOVERABLE: self.make_discoverable,
+            Event.API_BLUETOOTH_OFF: self.power_off,
+        }
+        get_event_router().subscribe(tuple(self._handlers), self._route)
 
-        # Set the discovery timeout
-        await self._adapter.set_discoverable_timeout(self.DISCOVERABLE_TIMEOUT)
+        return self
 
-        powered = await self._adapter.get_powered()
-        self._logger.info(
-            "The adapter hci%i was found powered %s.",
-            self._hci,
-            "on" if powered else "off",
-        )
-        # Start in a well defined state: Powered off
-        if powered:
-            await self.power_off()
-
-        # Register event handler
-        get_event_router().subscribe(
-            (Event.KEY_OPENCLOSE, Event.API_BLUETOOTH_ON),
-            lambda e, c: self._tg.create_task(self.power_on()),
-        )
-        get_event_router().subscribe(
-            (Event.KEY_OPENCLOSE_LONG, Event.API_BLUETOOTH_DISCOVERABLE),
-            lambda e, c: self._tg.create_task(self.make_discoverable()),
-        )
-        get_event_router().subscribe(
-            (Event.API_BLUETOOTH_OFF,),
-            lambda e, c: self._tg.create_task(self.power_off()),
-        )
+    def _read_persisted_state(self) -> "str | None":
+        """Read the adapter power state persisted by the last power change"""
+        try:
+            return self._state_file.read_text().strip()
+        except OSError:
+            return None
 
-        return self
+    def _persist_state(self, state: str) -> None:
+        """Best-effort persist the adapter power state across restarts"""
+        try:
+            self._state_file.parent.mkdir(parents=True, exist_ok=True)
+            self._state_file.write_text(state)
+        except OSError:
+            self._logger.debug("Could not persist adapter state", exc_info=True)
+
+    def _route(self, event: Event, caller: str) -> None:
+        """Dispatch a routed event to the corresponding bluetooth action"""
+        self._create_task(self._handlers[event]())
+
+    def _create_task(self, coro: Coroutine) -> None:
+        """Schedule a fire-and-forget coroutine on the event loop
+
+        Bypasses the TaskGroup bookkeeping: a failed power or pairing action
+        should be logged, not cancel the whole application. The pending set
+        keeps a strong reference until the task is done."""
+        task = self._loop.create_task(self._run_logged(coro))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _run_logged(self, coro: Coroutine) -> None:
+        try:
+            await coro
+        except Exception:
+            self._logger.exception("Bluetooth action %s failed", coro.__qualname__)
 
     async def make_discoverable(self) -> None:
         """Turn BT on and make device discoverable"""
@@ -86,11 +212,25 @@ class BluetoothController:
             "Turning adapter on, make it discoverable for the next %s seconds",
             self.DISCOVERABLE_TIMEOUT,
         )
-        await self._adapter.set_powered(True)
-        await self._adapter.set_discoverable(True)
+        if self._powered:
+            # Already powered - only refresh the discoverable window
+            await self._adapter.set_discoverable(True)
+            return
+        # Set the cached state optimistically so rapid successive events do
+        # not issue duplicate writes; _on_properties_changed keeps it honest
+        self._powered = True
+        self._persist_state("on")
+        await gather(
+            self._adapter.set_powered(True),
+            self._adapter.set_discoverable(True),
+        )
 
     async def power_off(self) -> None:
+        if not self._powered:
+            return
         self._logger.info("Turning adapter off")
+        self._powered = False
+        self._persist_state("off")
         await self._adapter.set_powered(False)
 
     async def stop_discoverable(
@@ -104,17 +244,24 @@ class BluetoothController:
 
     async def trust_device(self, device_path: str) -> None:
         """Sets the specified device as trusted"""
-        device_introspection = await self._bus.introspect(
-            self.BLUEZ_DBUS_SERVICE_NAME, device_path
+        # All device objects share the org.bluez.Device1 schema, so one cached
+        # introspection serves every device path
+        device_introspection = await _introspect_cached(
+            self._bus,
+            self.BLUEZ_DBUS_SERVICE_NAME,
+            device_path,
+            key=(self.BLUEZ_DBUS_SERVICE_NAME, "org.bluez.Device1"),
         )
         device_object = self._bus.get_proxy_object(
             self.BLUEZ_DBUS_SERVICE_NAME, device_path, device_introspection
         )
         device = device_object.get_interface("org.bluez.Device1")
         await device.set_trusted(True)
-        self._logger.info(
-            "Trust device %s (%s)", await device.get_alias(), await device.get_address()
-        )
+        # The alias and address are only needed for the log message, so do not
+        # pay the DBus round-trips when INFO is filtered out anyway
+        if self._logger.isEnabledFor(logging.INFO):
+            alias, address = await gather(device.get_alias(), device.get_address())
+            self._logger.info("Trust device %s (%s)", alias, address)
 
     async def forget_device(self, device_path: str) -> None:
         """Forgets the state of the specified device"""
@@ -127,8 +274,8 @@ class BluetoothController:
         self._bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
 
         adapter_path = f"/org/bluez/hci{self._hci}"
-        adapter_introspection = await self._bus.introspect(
-            self.BLUEZ_DBUS_SERVICE_NAME, adapter_path
+        adapter_introspection = await _introspect_cached(
+            self._bus, self.BLUEZ_DBUS_SERVICE_NAME, adapter_path
         )
         adapter_object = self._bus.get_proxy_object(
             self.BLUEZ_DBUS_SERVICE_NAME, adapter_path, adapter_introspection
@@ -137,8 +284,23 @@ class BluetoothController:
         # https://git.kernel.org/pub/scm/bluetooth/bluez.git/tree/doc/org.bluez.Adapter.rst
         self._adapter = adapter_object.get_interface("org.bluez.Adapter1")
 
+        # Track the power state from change notifications, so power_on and
+        # power_off can short-circuit without a DBus round-trip
+        properties = adapter_object.get_interface("org.freedesktop.DBus.Properties")
+        properties.on_properties_changed(self._on_properties_changed)
+
         self._agent = await _BluetoothAgent.register_agent(self)
 
+    def _on_properties_changed(
+        self, interface: str, changed: dict, invalidated: list
+    ) -> None:
+        """Update the cached adapter state from DBus change notifications"""
+        if interface == "org.bluez.Adapter1" and "Powered" in changed:
+            self._powered = changed["Powered"].value
+            self._logger.debug(
+                "Adapter reported powered %s", "on" if self._powered else "off"
+            )
+
     def __await__(self) -> Generator[Any, Any, "BluetoothController"]:
         """Make the object itself awaitable"""
         return self._init().__await__()
@@ -159,18 +321,11 @@ class _BluetoothAgent(ServiceInterface):
 
     def __init__(self, controller: BluetoothController, bus: MessageBus):
         self._controller = controller
+        self._loop = get_running_loop()
 
-        # Use the module name for the bus name and the path, with a fallback
-        self.bus_name = (
-            __name__
-            if is_bus_name_valid(__name__)
-            else "audio_controller.bluetooth_agent"
-        )
+        self.bus_name = _AGENT_BUS_NAME
         super().__init__("org.bluez.Agent1")
-        path = "/" + __name__.replace(".", "/")
-        self.path = (
-            path if is_object_path_valid(path) else "/audio_controller/bluetooth_agent"
-        )
+        self.path = _AGENT_PATH
         controller._logger.info(
             "Exporting bluetooth agent on bus '%s', path '%s'", self.bus_name, self.path
         )
@@ -182,8 +337,8 @@ class _BluetoothAgent(ServiceInterface):
         agent = _BluetoothAgent(controller, controller._bus)
 
         agent_manager_path = "/org/bluez"
-        agent_manager_introspection = await controller._bus.introspect(
-            controller.BLUEZ_DBUS_SERVICE_NAME, agent_manager_path
+        agent_manager_introspection = await _introspect_cached(
+            controller._bus, controller.BLUEZ_DBUS_SERVICE_NAME, agent_manager_path
         )
         agent_manager_object = controller._bus.get_proxy_object(
             controller.BLUEZ_DBUS_SERVICE_NAME,
@@ -203,7 +358,7 @@ class _BluetoothAgent(ServiceInterface):
         got paired"""
         self.stop_pairing_mode()  # Cancel the timer
         self._allow_pairing = True
-        self._pairing_timeout_timer = get_running_loop().call_later(
+        self._pairing_timeout_timer = self._loop.call_later(
             self.PAIRING_TIMEOUT, self.stop_pairing_mode
         )
 
@@ -231,11 +386,11 @@ class _BluetoothAgent(ServiceInterface):
                 "Authorize device on path %s with UUID %s", device, uuid
             )
             self.stop_pairing_mode()
-            self._controller._tg.create_task(self._controller.trust_device(device))
-            self._controller._tg.create_task(self._controller.stop_discoverable())
+            self._controller._create_task(self._controller.trust_device(device))
+            self._controller._create_task(self._controller.stop_discoverable())
         else:
             # Forget the device state, this enables later pairing attempts
-            self._controller._tg.create_task(self._controller.forget_device(device))
+            self._controller._create_task(self._controller.forget_device(device))
             raise DBusError("org.bluez.Error.Rejected", "Not in pairing mode")
 
     @method()
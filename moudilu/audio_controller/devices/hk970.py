@@ -1,4 +1,4 @@
-from asyncio import TimerHandle, get_running_loop
+from asyncio import TaskGroup, TimerHandle, get_running_loop, to_thread
 from logging import getLogger
 from typing import Union
 
@@ -14,13 +14,33 @@ class HK970:
     Amp is controlled with IR commands issued with Lirc.
     """
 
-    _shutdown_timer: Union[TimerHandle, None] = None
-    """Timer which schedules delayed powering off of the amp"""
+    __slots__ = (
+        "_lirc",
+        "_tg",
+        "_loop",
+        "_logger",
+        "_shutdown_timer",
+        "_cmd_on",
+        "_cmd_off",
+        "_is_on",
+    )
+
     SHUTDOWN_DELAY: float = 60
     """Delay in seconds to wait before turning amp off after playback stops"""
 
-    def __init__(self) -> None:
+    def __init__(self, tg: TaskGroup) -> None:
+        self._shutdown_timer: Union[TimerHandle, None] = None
+        """Timer which schedules delayed powering off of the amp"""
+        self._is_on: Union[bool, None] = None
+        """Last commanded amp state, None while still unknown"""
         self._lirc = Client()
+        # Preformatted (remote, key) pairs, so the hot path allocates nothing
+        self._cmd_on = ("HK970", "KEY_POWER")
+        self._cmd_off = ("HK970", "KEY_SLEEP")
+        self._tg = tg
+        # Constructed from within the running loop, so cache it here instead
+        # of walking the thread state on every playback event
+        self._loop = get_running_loop()
 
         get_event_router().subscribe((Event.PLAYBACK_START,), self.playback_start)
         get_event_router().subscribe((Event.PLAYBACK_STOP,), self.playback_stop)
@@ -29,22 +49,31 @@ class HK970:
 
         # Start in a well defined state
         # If stream is currently running, amp will be restarted soon after by an event
-        self.power_off()
+        tg.create_task(self.power_off())
 
     def playback_stop(self, event: Event, caller: str) -> None:
-        self._shutdown_timer = get_running_loop().call_later(
-            self.SHUTDOWN_DELAY, self.power_off
+        self._shutdown_timer = self._loop.call_later(
+            self.SHUTDOWN_DELAY, lambda: self._tg.create_task(self.power_off())
         )
 
     def playback_start(self, event: Event, caller: str) -> None:
         if self._shutdown_timer is not None:
             self._shutdown_timer.cancel()
-        self.power_on()
+        self._tg.create_task(self.power_on())
 
-    def power_on(self) -> None:
-        self._lirc.send_once("HK970", "KEY_POWER")
+    async def power_on(self) -> None:
+        if self._is_on is True:
+            # Amp was already commanded on, do not repeat the IR traffic
+            return
+        self._is_on = True
+        # lirc talks to lircd over a blocking socket - keep that round-trip
+        # off the event loop thread
+        await to_thread(self._lirc.send_once, *self._cmd_on)
         self._logger.info("Power HK970 on")
 
-    def power_off(self) -> None:
-        self._lirc.send_once("HK970", "KEY_SLEEP")
+    async def power_off(self) -> None:
+        if self._is_on is False:
+            return
+        self._is_on = False
+        await to_thread(self._lirc.send_once, *self._cmd_off)
         self._logger.info("Power HK970 off")
@@ -1,33 +1,70 @@
-from asyncio import sleep, TaskGroup
-from logging import getLogger
-from os.path import isfile
+from asyncio import Task, wait_for, TaskGroup
+from logging import DEBUG, INFO, getLogger
+from os import O_RDONLY, close, open as os_open, preadv
+from os.path import dirname, isfile
+from re import compile as re_compile
+from typing import ClassVar, Union
+
+from asyncinotify import Inotify, Mask, Watch
 
 from psutil import NoSuchProcess, AccessDenied, Process
 
 from ..event_router import Event, get_event_router
 
+_OWNER_PID_RE = re_compile(rb"owner_pid\s*:\s*(\d+)")
+"""Matches the owner_pid line of the status file, e.g. 'owner_pid   : 615'"""
+
 
 class PcmMonitor:
     """Monitor ALSA PCM devices.
 
     Send events when playback on these start or stop."""
 
-    period: float = 1
-    """Interval at which status of PCM device is polled"""
+    heartbeat: float = 5
+    """Interval in seconds at which the PCM device is re-checked even without a
+    filesystem notification. procfs supports inotify only partially, so the
+    heartbeat catches state changes a notification missed."""
 
     was_closed: bool
     """Last read state of the PCM device"""
 
-    def __init__(self, tg: TaskGroup, device: str, subdevice: int = 0) -> None:
+    _last_status: "tuple[bool, Union[int, None]]" = (True, None)
+    """Closed state and owner PID from the last status file read"""
+
+    _fd: Union[int, None] = None
+    """Persistent file descriptor of the status file"""
+
+    _watch: Union[Watch, None] = None
+    """Inotify watch on the directory of the status file"""
+
+    _started: bool = False
+    """Whether the initial state of this device has been determined"""
+
+    _instances: ClassVar["list[PcmMonitor]"] = []
+    """All registered monitors, checked by the shared monitoring task"""
+
+    _monitor_task: ClassVar[Union[Task, None]] = None
+    """The monitoring task shared by all instances"""
+
+    def __init__(
+        self, tg: TaskGroup, device: str, subdevice: int = 0, router=None
+    ) -> None:
+        """
+        :param router: Event router to send the playback events to. Defaults
+                       to the global singleton.
+        """
         self.device = device
         self.subdevice = subdevice
         self.device_name = f"{device}.{subdevice}"
+        self._caller = f"{device} PCM device"
         self._status_file = (
             f"/proc/asound/{self.device}/pcm0p/sub{self.subdevice}/status"
         )
 
-        self._router = get_event_router()
+        self._router = router if router is not None else get_event_router()
         self._logger = getLogger(self.device_name)
+        self._buf = bytearray(512)
+        """Read buffer reused across status checks"""
 
         if not isfile(self._status_file):
             self._logger.warning(
@@ -36,47 +73,89 @@ class PcmMonitor:
                 self.device_name,
             )
 
-        # Instantiate the monitoring task
-        tg.create_task(self.monitor())
+        # Register with the shared monitoring task, creating it on first use
+        PcmMonitor._instances.append(self)
+        if PcmMonitor._monitor_task is None:
+            PcmMonitor._monitor_task = tg.create_task(PcmMonitor._monitor_all())
 
-    async def monitor(self) -> None:
-        """Runs infinite loop
+    @classmethod
+    async def _monitor_all(cls) -> None:
+        """Runs infinite loop monitoring all registered PCM devices
 
-        Sends events when playback starts/stops.
-        First sends the event for the currently detected state.
+        A single task serves every monitor: it wakes on a filesystem
+        notification for any watched device (or on the heartbeat, since
+        procfs misses notifications) and re-checks all devices, instead of
+        scheduling one task and one timer per device.
         """
-        self.was_closed = self.is_closed()
-        self._logger.info(
-            "%s was %s at startup. Start monitoring.",
-            self.device_name,
-            "stopped" if self.was_closed else "running",
-        )
-        await self.send_event(self.was_closed)
+        with Inotify() as inotify:
+            while True:
+                for monitor in cls._instances:
+                    monitor._check(inotify)
+                try:
+                    await wait_for(inotify.get(), cls.heartbeat)
+                except TimeoutError:
+                    # No notification - heartbeat re-check
+                    pass
+
+    def _check(self, inotify: Inotify) -> None:
+        """Determine the device state and send events on changes
+
+        The first call sends the event for the currently detected state.
+        """
+        if self._watch is None:
+            self._watch = self._add_watch(inotify)
+        if not self._started:
+            self._started = True
+            self.was_closed = self.is_closed()
+            self._logger.info(
+                "%s was %s at startup. Start monitoring.",
+                self.device_name,
+                "stopped" if self.was_closed else "running",
+            )
+            self.send_event(self.was_closed)
+        elif (state := self.is_closed()) != self.was_closed:
+            self.send_event(state)
+            self.was_closed = state
+
+    def _add_watch(self, inotify: Inotify) -> Union[Watch, None]:
+        """Watch the directory of the status file
+
+        :returns: The created watch, or None if the directory does not exist
+                  (yet), e.g. because the device is disconnected.
+        """
+        try:
+            return inotify.add_watch(
+                dirname(self._status_file),
+                Mask.MODIFY | Mask.CLOSE_WRITE | Mask.CREATE | Mask.DELETE,
+            )
+        except OSError:
+            self._logger.warning(
+                "Cannot watch status file of %s, fall back to heartbeat polling",
+                self.device_name,
+            )
+            return None
 
-        while True:
-            if (state := self.is_closed()) != self.was_closed:
-                await self.send_event(state)
-                self.was_closed = state
-            await sleep(self.period)
+    def send_event(self, is_closed: bool) -> None:
+        """Send playback event
 
-    async def send_event(self, is_closed: bool) -> None:
-        """Send playback event"""
+        Synchronous on purpose: the procfs read and the router fan-out never
+        actually block, so the per-event coroutine machinery was pure
+        overhead."""
         if is_closed is True:
             self._logger.info(
                 "Detected stop of playback on %s PCM device", self.device_name
             )
-            await self._router.fire_event(
-                Event.PLAYBACK_STOP, f"{self.device} PCM device"
-            )
+            self._router.fire_event_nowait(Event.PLAYBACK_STOP, self._caller)
         else:
-            self._logger.info(
-                "Process '%s' started playback on %s PCM device",
-                self.get_playing_process(),
-                self.device_name,
-            )
-            await self._router.fire_event(
-                Event.PLAYBACK_START, f"{self.device} PCM device"
-            )
+            # Resolving the process commandline is only needed for the log
+            # message, skip it when INFO is filtered out
+            if self._logger.isEnabledFor(INFO):
+                self._logger.info(
+                    "Process '%s' started playback on %s PCM device",
+                    self.get_playing_process(),
+                    self.device_name,
+                )
+            self._router.fire_event_nowait(Event.PLAYBACK_START, self._caller)
 
     def is_closed(self) -> bool:
         """Detects if this device is closed or not.
@@ -84,46 +163,72 @@ class PcmMonitor:
         Returns true if the state of this device is closed.
         Otherwhise (running, closing, ...) returns false.
         """
+        return self._read_status()[0]
+
+    def _read_status(self) -> "tuple[bool, Union[int, None]]":
+        """Read the status file once, parsing state and owner PID in one pass
+
+        The result is cached on the instance, so the process lookup triggered
+        by the same state change does not read the file a second time. Reads
+        go through a persistent file descriptor with pread, skipping the
+        reopen and the Python IO stack on every check.
+
+        :returns: Tuple of the closed state and the PID of the playing
+                  process, if any.
+        """
         try:
-            with open(self._status_file, "r") as soundStatusfile:
-                status = soundStatusfile.readline().strip("\n")
-            self._logger.debug("%s status: %s", self.device_name, status)
-            return status == "closed"
-        except FileNotFoundError:
+            if self._fd is None:
+                self._fd = os_open(self._status_file, O_RDONLY)
+            length = preadv(self._fd, (self._buf,), 0)
+        except OSError:
+            length = 0
+        if length <= 0:
+            # Read failed or came back empty - drop the fd and reopen lazily,
+            # the device may have been disconnected
+            if self._fd is not None:
+                try:
+                    close(self._fd)
+                except OSError:
+                    pass
+                self._fd = None
             self._logger.warning(
-                "Status file for %s not found. Device may be disconnected.",
+                "Status file for %s not readable. Device may be disconnected.",
                 self.device_name,
             )
-            return True
+            self._last_status = (True, None)
+            return self._last_status
+
+        # Parse in place - no slices or decoded strings on the happy path
+        buf = self._buf
+        end = buf.find(b"\n", 0, length)
+        if end < 0:
+            end = length
+        if self._logger.isEnabledFor(DEBUG):
+            self._logger.debug("%s status: %s", self.device_name, bytes(buf[:end]))
+        match = _OWNER_PID_RE.search(buf, 0, length)
+        owner_pid = int(match.group(1)) if match else None
+        self._last_status = (end == 6 and buf.startswith(b"closed"), owner_pid)
+        return self._last_status
+
+    def __del__(self) -> None:
+        if self._fd is not None:
+            try:
+                close(self._fd)
+            except OSError:
+                pass
 
     def get_playing_process(self) -> str:
         """Gets the process currently playing on this device
 
+        Uses the owner PID from the last status file read.
+
         :returns: Commandline of the process currently playing on this device.
                   'UNKNOWN' if nothing is playing.
         """
-        try:
-            with open(self._status_file, "r") as soundStatusfile:
-                for line in soundStatusfile:
-                    if line.startswith("owner_pid"):
-                        # Expect this line in the second line in format
-                        # owner_pid   : 615
-                        try:
-                            tid = int(line.split(":")[-1].strip())
-                            cmd = Process(tid).cmdline()
-                            return " ".join(cmd)
-                        except ValueError:
-                            self._logger.exception(
-                                "Failed to read PID from line '%s'", line
-                            )
-                        except (NoSuchProcess, AccessDenied):
-                            self._logger.exception(
-                                "Failed to get info of process from line '%s'", line
-                            )
-        except FileNotFoundError:
-            self._logger.warning(
-                "Status file for %s not found. Device may be disconnected.",
-                self.device_name,
-            )
-
+        pid = self._last_status[1]
+        if pid is not None:
+            try:
+                return " ".join(Process(pid).cmdline())
+            except (NoSuchProcess, AccessDenied):
+                self._logger.exception("Failed to get info of process %i", pid)
         return "UNKNOWN"
@@ -1,4 +1,3 @@
-from ast import Tuple
 from asyncio import TaskGroup
 from logging import getLogger
 from typing import Dict
@@ -42,6 +41,13 @@ class RemoteControl:
         """For key currently pressed that have registered longpress events, holds the
         timestamp it had been pressed"""
 
+        self._tracked_codes = frozenset(
+            ecodes.ecodes[key]
+            for key in self.KEY_EVENTS.keys() | self.KEY_EVENTS_LONGPRESS.keys()
+        )
+        """Integer codes of all mapped keys, to filter events cheaply before
+        any further processing"""
+
         # Instantiate the monitoring task
         tg.create_task(self._read_keys())
 
@@ -49,51 +55,46 @@ class RemoteControl:
         self._logger.debug("Reading events from %s", self.device)
 
         async for ev in self.device.async_read_loop():
-            if ev.type == ecodes.EV_KEY:
-                ev = KeyEvent(ev)
-
-                # Theoretically it is possible that one code is mapped to several
-                # keycodes. In this case, just take the first one.
-                if isinstance(ev.keycode, Tuple):
-                    self._logger.warning(
-                        "Key with several keycodes received: %s. Use %s.",
-                        ev.keycode,
-                        ev.keycode[0],
-                    )
-                    ev.keycode = ev.keycode[0]
-
+            # Cheap reject on the raw event: anything but a key event for a
+            # mapped key is of no interest, so skip it before any wrapping
+            if ev.type != ecodes.EV_KEY or ev.code not in self._tracked_codes:
+                continue
+
+            ev = KeyEvent(ev)
+
+            # Theoretically it is possible that one code is mapped to several
+            # keycodes. In this case, just take the first one.
+            if isinstance(ev.keycode, tuple):
+                self._logger.warning(
+                    "Key with several keycodes received: %s. Use %s.",
+                    ev.keycode,
+                    ev.keycode[0],
+                )
+                ev.keycode = ev.keycode[0]
+
+            if ev.keystate == ev.key_down and ev.keycode in self.KEY_EVENTS_LONGPRESS:
+                # There is an event for a longpress for this key, track how long it
+                # is pressed
+                self._key_down_timestamps[ev.keycode] = ev.event.timestamp()
+
+            elif ev.keystate == ev.key_up:
+                # A key has been released - emit corresponding event if available
+                now = ev.event.timestamp()
+                # Remove the timestamp registered for this key, if any
+                key_down = self._key_down_timestamps.pop(ev.keycode, None)
                 if (
-                    ev.keystate == ev.key_down
-                    and ev.keycode in self.KEY_EVENTS_LONGPRESS
+                    key_down is not None
+                    and (now - key_down) >= self.LONGPRESS_THRESHOLD
                 ):
-                    # There is an event for a longpress for this key, track how long it
-                    # is pressed
-                    self._key_down_timestamps[ev.keycode] = ev.event.timestamp()
-
-                elif ev.keystate == ev.key_up:
-                    # A key has been released - emit corresponding event if available
-                    if (
-                        ev.keycode in self._key_down_timestamps
-                        and (
-                            ev.event.timestamp() - self._key_down_timestamps[ev.keycode]
-                        )
-                        >= self.LONGPRESS_THRESHOLD
-                    ):
-                        # the key was pressed for long and there is an longpress event
-                        # registered, fire it
-                        self._logger.info("%s long pressed", ev.keycode)
-                        await self._router.fire_event(
-                            self.KEY_EVENTS_LONGPRESS[ev.keycode], self.device_name
-                        )
-                    elif ev.keycode in self.KEY_EVENTS:
-                        # fire the normal event for this key
-                        self._logger.info("%s pressed", ev.keycode)
-                        await self._router.fire_event(
-                            self.KEY_EVENTS[ev.keycode], self.device_name
-                        )
-
-                    # If there is a timestamp registered for this key, remove it
-                    try:
-                        del self._key_down_timestamps[ev.keycode]
-                    except KeyError:
-                        pass
+                    # the key was pressed for long and there is an longpress event
+                    # registered, fire it
+                    self._logger.info("%s long pressed", ev.keycode)
+                    await self._router.fire_event(
+                        self.KEY_EVENTS_LONGPRESS[ev.keycode], self.device_name
+                    )
+                elif ev.keycode in self.KEY_EVENTS:
+                    # fire the normal event for this key
+                    self._logger.info("%s pressed", ev.keycode)
+                    await self._router.fire_event(
+                        self.KEY_EVENTS[ev.keycode], self.device_name
+                    )
@@ -1,54 +1,66 @@
 from asyncio import TaskGroup
-import itertools
+from functools import lru_cache
 import logging
+import socket
 
 import uvicorn
-from fastapi import FastAPI, APIRouter, Request
 
 from ..event_router import get_event_router, Event
 
-# Operations for bluetooth
-bluetooth = APIRouter(prefix="/bluetooth")
+_LOG = logging.getLogger("API")
 
+_ROUTER = get_event_router()
+"""Bound once at import: this module is only imported from within the running
+loop, at which point the router singleton is safe to create"""
 
-@bluetooth.get("/on")
-async def bluetooth_on(request: Request):
-    """Turn on Bluetooth."""
-    await get_event_router().fire_event(
-        Event.API_BLUETOOTH_ON, f"REST API call from {request.client.host}"
-    )
-    logging.getLogger("API").debug(
-        "Received request to turn on Bluetooth from %s", request.client.host
-    )
+_ROUTES = {
+    "/api/v1/bluetooth/on": Event.API_BLUETOOTH_ON,
+    "/api/v1/bluetooth/off": Event.API_BLUETOOTH_OFF,
+    "/api/v1/bluetooth/discoverable": Event.API_BLUETOOTH_DISCOVERABLE,
+}
+"""Maps the served request paths to the events they fire"""
 
+_HEADERS = [(b"content-type", b"application/json")]
+_BODY_OK = b'{"ok":true}'
+_BODY_NOT_FOUND = b'{"detail":"Not Found"}'
+_BODY_METHOD_NOT_ALLOWED = b'{"detail":"Method Not Allowed"}'
 
-@bluetooth.get("/off")
-async def bluetooth_off(request: Request):
-    """Turn off Bluetooth."""
-    await get_event_router().fire_event(
-        Event.API_BLUETOOTH_OFF, f"REST API call from {request.client.host}"
-    )
-    logging.getLogger("API").debug(
-        "Received request to turn off Bluetooth from %s", request.client.host
-    )
 
+@lru_cache(maxsize=256)
+def _caller(host: str) -> str:
+    """Caller string for the event router, cached per client host"""
+    return f"REST API call from {host}"
 
-@bluetooth.get("/discoverable")
-async def bluetooth_discoverable(request: Request):
-    """Make Bluetooth discoverable"""
-    await get_event_router().fire_event(
-        Event.API_BLUETOOTH_DISCOVERABLE, f"REST API call from {request.client.host}"
-    )
-    logging.getLogger("API").debug(
-        "Received request to make Bluetooth discoverable from %s", request.client.host
-    )
 
+async def app(scope, receive, send) -> None:
+    """Minimal ASGI application serving the bluetooth endpoints
 
-# Create the main FastAPI app and include the router
-api = APIRouter(prefix="/api/v1")
-api.include_router(bluetooth)
-app = FastAPI()
-app.include_router(api)
+    Each endpoint does nothing but fire one event, so the routing, dependency
+    injection and response modelling of a full framework would dominate the
+    actual work by far. Dispatch on the raw ASGI scope instead."""
+    if scope["type"] == "lifespan":
+        # Acknowledge uvicorn's lifespan protocol probe
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    event = _ROUTES.get(scope["path"])
+    if event is None:
+        status, body = 404, _BODY_NOT_FOUND
+    elif scope["method"] != "GET":
+        status, body = 405, _BODY_METHOD_NOT_ALLOWED
+    else:
+        client = scope["client"]
+        host = client[0] if client else "unknown"
+        _ROUTER.fire_event_nowait(event, _caller(host))
+        _LOG.debug("Received request to fire %s from %s", event.name, host)
+        status, body = 200, _BODY_OK
+    await send({"type": "http.response.start", "status": status, "headers": _HEADERS})
+    await send({"type": "http.response.body", "body": body})
 
 
 class RestApi:
@@ -61,17 +73,25 @@ class RestApi:
         :tg: The task group to which the API server will be added.
         :ports: List of ports to serve the API on.
         """
-        # For each port, create a server both on IPv4 and IPv6
-        for ip, port in itertools.product(("::", "0.0.0.0"), ports):
-            # This instantiates a server programmatically. Note that this is not the
-            # recommended way to start a FastAPI app (which would be to invoke it via
-            # the fastapi command)
-            # The server is started with the default asyncio implementation instead of
-            # the faster uvloop.
+        # For each port, create a single dual-stack socket: an AF_INET6
+        # socket with V6ONLY disabled also accepts IPv4 connections as
+        # v4-mapped addresses, so no separate IPv4 server is needed
+        self._sockets = []
+        for port in ports:
+            sock = socket.socket(socket.AF_INET6, socket.SOCK_STREAM)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.setsockopt(socket.IPPROTO_IPV6, socket.IPV6_V6ONLY, 0)
+            sock.bind(("::", port))
+            sock.listen(128)
+            # Keep the socket object referenced, its fd has to outlive us
+            self._sockets.append(sock)
+            # This instantiates a server programmatically. The server runs on
+            # the already running event loop, which main() sets up as uvloop
+            # unless disabled.
             config = uvicorn.Config(
                 __name__ + ":app",
-                host=ip,
-                port=port,
+                fd=sock.fileno(),
+                http="httptools",
                 log_config=None,
                 access_log=False,
             )
@@ -1,12 +1,11 @@
 from asyncio import Future, get_running_loop
-from collections import defaultdict
-from enum import StrEnum, auto
+from enum import IntEnum, auto
 from logging import Logger
 import logging
-from typing import Callable, Dict, Iterable
+from typing import Callable, Iterable
 
 
-class Event(StrEnum):
+class Event(IntEnum):
     PLAYBACK_START = auto()
     PLAYBACK_STOP = auto()
     KEY_OPENCLOSE = auto()
@@ -23,19 +22,29 @@ def get_event_router() -> "get_event_router._EventRouter":
     start routing of events."""
 
     class _EventRouter:
-        _callbacks: Dict[Event, set[Callable[[Event, str], None]]] = defaultdict(lambda: set())  # type: ignore # noqa: E501
-        """Dictionary of all callbacks to be called on specific events"""
-
         def __init__(self) -> None:
+            self._callbacks: list[tuple[Callable[[Event, str], None], ...]] = [
+                () for _ in range(max(Event) + 1)
+            ]
+            """Callbacks to be called on specific events, indexed by event"""
             self._logger: Logger = logging.getLogger("EventRouter")
             self._start_routing: Future = get_running_loop().create_future()
+            self._routing_started: bool = False
+            """Set once start_routing was called; lets the fire path skip
+            awaiting the already resolved future"""
+            self._deferred: set = set()
+            """Strong references to tasks for events fired before routing
+            started"""
 
         def subscribe(
             self, events: Iterable[Event], callback: Callable[[Event, str], None]
         ) -> None:
             """Register callback function to be forwarded the specified events"""
             for event in events:
-                self._callbacks[event].add(callback)
+                # Deduplicate on subscription, the fire path iterates blindly
+                if callback in self._callbacks[event]:
+                    continue
+                self._callbacks[event] += (callback,)
                 self._logger.debug(
                     "Add event callback %s for event %s", callback, event
                 )
@@ -46,20 +55,41 @@ def get_event_router() -> "get_event_router._EventRouter":
             :param event: Event enum
             : param caller: String representing who fired the event
             """
-            await self._start_routing
-            for c in self._callbacks[event]:
+            if not self._routing_started:
+                await self._start_routing
+            self.fire_event_nowait(event, caller)
+
+        def fire_event_nowait(self, event: Event, caller: str) -> None:
+            """Broadcast an event to all listeners without suspending
+
+            The callbacks are synchronous, so once routing has started no
+            coroutine machinery is needed for the fan-out. Events fired
+            before start_routing are deferred onto the event loop.
+
+            :param event: Event enum
+            : param caller: String representing who fired the event
+            """
+            if not self._routing_started:
+                task = get_running_loop().create_task(self.fire_event(event, caller))
+                self._deferred.add(task)
+                task.add_done_callback(self._deferred.discard)
+                return
+            callbacks = self._callbacks[event]
+            for c in callbacks:
                 c(event, caller)
-            self._logger.debug(
-                "Called %i callbacks with event %s from %s",
-                len(self._callbacks[event]),
-                event,
-                caller,
-            )
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug(
+                    "Called %i callbacks with event %s from %s",
+                    len(callbacks),
+                    event,
+                    caller,
+                )
 
         def start_routing(self) -> None:
             """Start to route events.
 
             Has to be called before any events start to be distributed"""
+            self._routing_started = True
             self._start_routing.set_result(None)
             self._logger.debug("Start routing events")
 